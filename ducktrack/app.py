@@ -146,7 +146,8 @@ class MainInterface(QWidget):
             self.update_ui_for_recording(True)
         else:
             self.recorder_thread.stop_recording()
-            self.recorder_thread.terminate()
+            # Let run() flush and close the events file instead of killing the thread
+            self.recorder_thread.wait()
 
             recording_dir = self.recorder_thread.recording_path
             del self.recorder_thread
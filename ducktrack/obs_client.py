@@ -1,30 +1,140 @@
+import json
 import os
 import subprocess
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from platform import system
 import obsws_python as obs
-import psutil
 
-# Setup basic logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+OBS_PROCESS_NAMES = {"obs", "obs64", "obs32", "obs64.exe", "obs32.exe"}
+_OBS_COMM_NAMES = {name.encode() for name in OBS_PROCESS_NAMES}
+
 def is_obs_running() -> bool:
     """
     Checks if OBS is already running on the system.
     """
     try:
-        for process in psutil.process_iter(attrs=["pid", "name"]):
-            if "obs" in process.info["name"].lower():
-                logger.info("OBS is running.")
-                return True
-        logger.info("OBS is not running.")
-        return False
+        match system():
+            case "Linux" if os.path.isdir("/proc"):
+                running = _is_obs_running_procfs()
+            case "Windows":
+                running = _is_obs_running_toolhelp()
+            case "Darwin":
+                running = _is_obs_running_libproc()
+            case _:
+                running = _is_obs_running_psutil()
+        logger.info("OBS is running." if running else "OBS is not running.")
+        return running
     except Exception as e:
         logger.error(f"Error checking if OBS is running: {e}")
         raise Exception(f"Error checking if OBS is running: {e}")
 
+def _is_obs_running_psutil() -> bool:
+    """
+    Portable fallback for platforms without a native scan below.
+    """
+    import psutil
+    return any(
+        (process.info["name"] or "").lower() in OBS_PROCESS_NAMES
+        for process in psutil.process_iter(attrs=["name"])
+    )
+
+def _is_obs_running_toolhelp() -> bool:
+    """
+    Walks a single Toolhelp32 process snapshot (Windows).
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            if entry.szExeFile.lower() in OBS_PROCESS_NAMES:
+                return True
+            more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+def _is_obs_running_libproc() -> bool:
+    """
+    Lists all pids with one proc_listpids call and checks each proc_name (macOS).
+    """
+    import ctypes
+
+    PROC_ALL_PIDS = 1
+    libproc = ctypes.CDLL("/usr/lib/libproc.dylib")
+
+    # First call returns the buffer size needed; leave headroom for new processes
+    size = libproc.proc_listpids(PROC_ALL_PIDS, 0, None, 0)
+    if size <= 0:
+        raise OSError(ctypes.get_errno(), "proc_listpids failed")
+    pids = (ctypes.c_int * (size // ctypes.sizeof(ctypes.c_int) + 64))()
+    size = libproc.proc_listpids(PROC_ALL_PIDS, 0, pids, ctypes.sizeof(pids))
+
+    name = ctypes.create_string_buffer(64)
+    for pid in pids[:size // ctypes.sizeof(ctypes.c_int)]:
+        if pid and libproc.proc_name(pid, name, ctypes.sizeof(name)) > 0:
+            if name.value.lower() in _OBS_COMM_NAMES:
+                return True
+    return False
+
+def _is_obs_running_procfs() -> bool:
+    """
+    Scans /proc/<pid>/comm directly, skipping psutil's per-process objects.
+    """
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                fd = os.open(f"/proc/{entry.name}/comm", os.O_RDONLY)
+            except OSError:
+                continue  # process exited or is not readable
+            try:
+                comm = os.read(fd, 64)
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
+            if comm.rstrip(b"\n").lower() in _OBS_COMM_NAMES:
+                return True
+    return False
+
 def close_obs(obs_process: subprocess.Popen):
     """
     Gracefully terminates the OBS process.
@@ -38,10 +148,19 @@ def close_obs(obs_process: subprocess.Popen):
             logger.warning("OBS process did not terminate in time. Forcing kill.")
             obs_process.kill()
 
+OBS_PATH_CACHE_FILE = Path.home() / ".cache" / "ducktrack" / "obs_path"
+
+@lru_cache(maxsize=1)
 def find_obs() -> str:
     """
     Finds the OBS executable path based on the operating system.
+    The resolved path is cached on disk so later launches skip the search.
     """
+    cached_path = _read_cached_obs_path()
+    if cached_path:
+        logger.info(f"Found OBS at {cached_path} (cached).")
+        return cached_path
+
     common_paths = {
         "Windows": [
             "C:\\Program Files\\obs-studio\\bin\\64bit\\obs64.exe",
@@ -60,6 +179,7 @@ def find_obs() -> str:
     for path in common_paths.get(system(), []):
         if os.path.exists(path):
             logger.info(f"Found OBS at {path}.")
+            _write_cached_obs_path(path)
             return path
 
     try:
@@ -70,6 +190,7 @@ def find_obs() -> str:
 
         if os.path.exists(obs_path):
             logger.info(f"Found OBS at {obs_path}.")
+            _write_cached_obs_path(obs_path)
             return obs_path
     except subprocess.CalledProcessError:
         logger.error("OBS executable not found.")
@@ -77,17 +198,37 @@ def find_obs() -> str:
 
     return "obs"  # Default fallback
 
+def _read_cached_obs_path() -> str | None:
+    """
+    Returns the cached OBS path if it still exists on disk.
+    """
+    try:
+        path = OBS_PATH_CACHE_FILE.read_text().strip()
+    except OSError:
+        return None
+    return path if path and os.path.exists(path) else None
+
+def _write_cached_obs_path(path: str):
+    """
+    Persists the resolved OBS path. Failures are not fatal.
+    """
+    try:
+        OBS_PATH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        OBS_PATH_CACHE_FILE.write_text(path)
+    except OSError as e:
+        logger.warning(f"Could not cache OBS path: {e}")
+
 def open_obs() -> subprocess.Popen:
     """
     Opens OBS Studio and starts the replay buffer.
     """
     try:
         obs_path = find_obs()
-        if system() == "Windows":
-            os.chdir(os.path.dirname(obs_path))
-            obs_path = os.path.basename(obs_path)
+        # OBS on Windows must start from its own directory to find its DLLs;
+        # only change the child's working directory, not ours
+        cwd = os.path.dirname(obs_path) if system() == "Windows" else None
         logger.info("Opening OBS Studio...")
-        return subprocess.Popen([obs_path, "--startreplaybuffer", "--minimize-to-tray"])
+        return subprocess.Popen([obs_path, "--startreplaybuffer", "--minimize-to-tray"], cwd=cwd or None)
     except Exception as e:
         logger.error(f"Failed to open OBS: {e}")
         raise Exception(f"Failed to open OBS: {e}")
@@ -116,9 +257,13 @@ class OBSClient:
             raise ValueError("Authentication enabled but no password provided.")
 
         try:
-            # Initialize WebSocket clients with authentication
-            self.req_client = obs.ReqClient(password=self.password)
-            self.event_client = obs.EventClient(password=self.password)
+            # Initialize WebSocket clients with authentication. obsws_python needs
+            # one connection per client, so run both handshakes concurrently.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                req_future = executor.submit(obs.ReqClient, password=self.password)
+                event_future = executor.submit(obs.EventClient, password=self.password)
+                self.req_client = req_future.result()
+                self.event_client = event_future.result()
         except obs.error.OBSSDKError as e:
             logger.error(f"Failed to authenticate with OBS WebSocket: {e}")
             raise Exception(f"Failed to authenticate with OBS WebSocket: {e}")
@@ -134,7 +279,8 @@ class OBSClient:
         """
         def on_record_state_changed(data):
             output_state = data.output_state
-            logger.info(f"Record state changed: {output_state}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Record state changed: %s", output_state)
             if output_state not in self.record_state_events:
                 self.record_state_events[output_state] = []
             self.record_state_events[output_state].append(time.perf_counter())
@@ -145,12 +291,13 @@ class OBSClient:
         """
         Configures OBS settings for the desired recording parameters.
         """
-        self.old_profile = self.req_client.get_profile_list().current_profile_name
+        profile_list = self.req_client.get_profile_list()
+        self.old_profile = profile_list.current_profile_name
 
         try:
             # Check if the profile already exists
             profile_name = "computer_tracker"
-            profiles = self.req_client.get_profile_list().profiles
+            profiles = profile_list.profiles
 
             if profile_name not in profiles:
                 logger.info(f"Profile '{profile_name}' not found. Creating it.")
@@ -172,29 +319,69 @@ class OBSClient:
 
         scaled_width, scaled_height = _scale_resolution(base_width, base_height, output_width, output_height)
 
-        self.req_client.set_profile_parameter("Video", "BaseCX", str(base_width))
-        self.req_client.set_profile_parameter("Video", "BaseCY", str(base_height))
-        self.req_client.set_profile_parameter("Video", "OutputCX", str(scaled_width))
-        self.req_client.set_profile_parameter("Video", "OutputCY", str(scaled_height))
-        self.req_client.set_profile_parameter("Video", "ScaleType", "lanczos")
+        bitrate = int(_get_bitrate_mbps(scaled_width, scaled_height, fps=fps) * 1000 / 50) * 50
 
-        self.req_client.set_profile_parameter("AdvOut", "RescaleRes", f"{base_width}x{base_height}")
-        self.req_client.set_profile_parameter("AdvOut", "RecRescaleRes", f"{base_width}x{base_height}")
-        self.req_client.set_profile_parameter("AdvOut", "FFRescaleRes", f"{base_width}x{base_height}")
+        self._set_profile_parameters([
+            ("Video", "BaseCX", str(base_width)),
+            ("Video", "BaseCY", str(base_height)),
+            ("Video", "OutputCX", str(scaled_width)),
+            ("Video", "OutputCY", str(scaled_height)),
+            ("Video", "ScaleType", "lanczos"),
 
-        self.req_client.set_profile_parameter("Video", "FPSCommon", str(fps))
-        self.req_client.set_profile_parameter("SimpleOutput", "RecFormat2", "mp4")
+            ("AdvOut", "RescaleRes", f"{base_width}x{base_height}"),
+            ("AdvOut", "RecRescaleRes", f"{base_width}x{base_height}"),
+            ("AdvOut", "FFRescaleRes", f"{base_width}x{base_height}"),
 
-        bitrate = int(_get_bitrate_mbps(scaled_width, scaled_height, fps=fps) * 1000 / 50) * 50
-        self.req_client.set_profile_parameter("SimpleOutput", "VBitrate", str(bitrate))
-        self.req_client.set_profile_parameter("SimpleOutput", "RecQuality", "Small")
-        self.req_client.set_profile_parameter("SimpleOutput", "FilePath", self.recording_path)
+            ("Video", "FPSCommon", str(fps)),
+            ("SimpleOutput", "RecFormat2", "mp4"),
+
+            ("SimpleOutput", "VBitrate", str(bitrate)),
+            ("SimpleOutput", "RecQuality", "Small"),
+            ("SimpleOutput", "FilePath", self.recording_path),
+        ])
 
         try:
             self.req_client.set_input_mute("Mic/Aux", muted=True)
         except obs.error.OBSSDKRequestError:
             logger.warning("No Mic/Aux input found. Skipping muting.")
 
+    def _set_profile_parameters(self, parameters):
+        """
+        Sets (category, name, value) profile parameters in a single RequestBatch round-trip.
+        obsws_python has no batch API, so the batch is sent over the ReqClient's socket.
+        """
+        payload = {
+            "op": 8,  # RequestBatch
+            "d": {
+                "requestId": "ducktrack-profile-parameters",
+                "haltOnFailure": False,
+                "requests": [
+                    {
+                        "requestType": "SetProfileParameter",
+                        "requestData": {
+                            "parameterCategory": category,
+                            "parameterName": name,
+                            "parameterValue": value,
+                        },
+                    }
+                    for category, name, value in parameters
+                ],
+            },
+        }
+
+        try:
+            ws = self.req_client.base_client.ws
+            ws.send(json.dumps(payload))
+            results = json.loads(ws.recv())["d"]["results"]
+        except Exception as e:
+            logger.error(f"Error setting profile parameters: {e}")
+            raise Exception(f"Error setting profile parameters: {e}")
+
+        for (category, name, _), result in zip(parameters, results):
+            status = result["requestStatus"]
+            if not status["result"]:
+                logger.warning(f"Failed to set profile parameter {category}.{name}: {status.get('comment')}")
+
     def start_recording(self):
         logger.info("Starting recording...")
         try:
@@ -228,24 +415,22 @@ class OBSClient:
             logger.error(f"Error resuming recording: {e}")
             raise Exception(f"Error resuming recording: {e}")
 
+# YouTube recommended bitrates in Mbps, keyed by (width, height, fps)
+_BITRATES_MBPS = {
+    (7680, 4320, 30): 120, (7680, 4320, 60): 180,
+    (3840, 2160, 30): 40, (3840, 2160, 60): 60.5,
+    (2160, 1440, 30): 16, (2160, 1440, 60): 24,
+    (1920, 1080, 30): 8, (1920, 1080, 60): 12,
+    (1280, 720, 30): 5, (1280, 720, 60): 7.5,
+    (640, 480, 30): 2.5, (640, 480, 60): 4,
+    (480, 360, 30): 1, (480, 360, 60): 1.5,
+}
+
 def _get_bitrate_mbps(width: int, height: int, fps=30) -> float:
     """
     Gets the YouTube recommended bitrate in Mbps for a given resolution and framerate.
     """
-    resolutions = {
-        (7680, 4320): {30: 120, 60: 180},
-        (3840, 2160): {30: 40, 60: 60.5},
-        (2160, 1440): {30: 16, 60: 24},
-        (1920, 1080): {30: 8, 60: 12},
-        (1280, 720): {30: 5, 60: 7.5},
-        (640, 480): {30: 2.5, 60: 4},
-        (480, 360): {30: 1, 60: 1.5},
-    }
-
-    for res, fps_dict in resolutions.items():
-        if (width, height) == res and fps in fps_dict:
-            return fps_dict[fps]
-    return 5  # Default bitrate
+    return _BITRATES_MBPS.get((width, height, fps), 5)  # Default bitrate
 
 def _scale_resolution(base_width, base_height, target_width, target_height):
     """
@@ -1,20 +1,19 @@
 import os
-import json
 import time
-from datetime import datetime
 from platform import system
-from queue import Queue, Empty
-from threading import Lock
+import heapq
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from threading import Event, Lock, Thread, local
+import orjson
 from pynput import keyboard, mouse
-from pynput.keyboard import KeyCode
 from PyQt6.QtCore import QThread, pyqtSignal
 from .metadata import MetadataManager
 from .obs_client import OBSClient
 from .util import fix_windows_dpi_scaling, get_recordings_dir
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Recorder(QThread):
@@ -25,6 +24,21 @@ class Recorder(QThread):
 
     recording_stopped = pyqtSignal()
 
+    # Events a producer thread buffers before waking the writer
+    BUFFER_CAPACITY = 256
+
+    # Userspace buffer for events.jsonl; flushed when the file is closed
+    EVENTS_FILE_BUFFER_SIZE = 1 << 20
+
+    # Pre-serialized event lines; the last field is always the time stamp
+    MOVE_EVENT = b'{"action":"move","x":%r,"y":%r,"time_stamp":%r}\n'
+    CLICK_EVENT = b'{"action":"click","x":%r,"y":%r,"button":%s,"pressed":%s,"time_stamp":%r}\n'
+    SCROLL_EVENT = b'{"action":"scroll","x":%r,"y":%r,"dx":%r,"dy":%r,"time_stamp":%r}\n'
+    PRESS_EVENT = b'{"action":"press","key":%s,"time_stamp":%r}\n'
+    RELEASE_EVENT = b'{"action":"release","key":%s,"time_stamp":%r}\n'
+    PAUSE_EVENT = b'{"action":"pause","time_stamp":%r}\n'
+    RESUME_EVENT = b'{"action":"resume","time_stamp":%r}\n'
+
     def __init__(self, natural_scrolling: bool, password: str):
         """
         Initializes the Recorder class with necessary settings.
@@ -43,39 +57,69 @@ class Recorder(QThread):
         self._is_paused = False
         self._lock = Lock()
 
-        # Event queue and file handling
-        self.event_queue = Queue()
+        # Per-thread event buffers and file handling. Each producer thread
+        # appends to its own deque (append/popleft are atomic) and only
+        # signals the consumer once per BUFFER_CAPACITY events.
+        self._local = local()
+        self._thread_buffers = []
+        self._thread_buffers_lock = Lock()
+        self._event_available = Event()
         self.events_file = None
 
-        # Metadata and OBS setup
+        # Serialized chunks handed from run() to the writer thread, which
+        # owns all writes to events_file so disk latency never stalls run()
+        self._write_queue = deque()
+        self._write_available = Event()
+        self._writer_done = False
+        self._writer_thread = None
+
+        # Mouse moves arriving faster than this are coalesced into the latest one
+        self._move_min_dt = 1.0 / 120
+        self._last_move_ts = 0.0
+        self._pending_move = None
+
+        # JSON-encoded key and button names, keyed by the pynput object
+        self._encoded_names = {}
+
+        # Metadata and OBS setup. OBSClient spends most of its time on the
+        # WebSocket handshake and profile configuration, so it is built in the
+        # background while the local setup below runs.
         self.metadata_manager = MetadataManager(
             recording_path=self.recording_path,
             natural_scrolling=natural_scrolling
         )
-        self.obs_client = OBSClient(
-            password=self.password,  # Pass the password to OBSClient
-            recording_path=self.recording_path,
-            metadata=self.metadata_manager.metadata
-        )
-
-        # Input listeners
-        self.mouse_listener = mouse.Listener(
-            on_move=self.on_move,
-            on_click=self.on_click,
-            on_scroll=self.on_scroll
-        )
-        self.keyboard_listener = keyboard.Listener(
-            on_press=self.on_press,
-            on_release=self.on_release
-        )
-
-        # DPI scaling fix for Windows
-        if system() == "Windows":
-            fix_windows_dpi_scaling()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            obs_client_future = executor.submit(
+                OBSClient,
+                password=self.password,  # Pass the password to OBSClient
+                recording_path=self.recording_path,
+                metadata=self.metadata_manager.metadata
+            )
+
+            # Input listeners
+            self.mouse_listener = mouse.Listener(
+                on_move=self.on_move,
+                on_click=self.on_click,
+                on_scroll=self.on_scroll
+            )
+            self.keyboard_listener = keyboard.Listener(
+                on_press=self.on_press,
+                on_release=self.on_release
+            )
+
+            # DPI scaling fix for Windows
+            if system() == "Windows":
+                fix_windows_dpi_scaling()
+
+            self.obs_client = obs_client_future.result()
 
     def run(self):
         """
         Starts the recording process and listens for events.
+
+        Events are drained from the per-thread buffers rather than delivered
+        as Qt signals: a queued signal costs a QEvent per mouse move, and a
+        slot on this object would run in the GUI thread that owns it.
         """
         self._is_recording = True
         try:
@@ -85,11 +129,18 @@ class Recorder(QThread):
             self._open_event_file()
 
             while self._is_recording:
-                try:
-                    event = self.event_queue.get(timeout=0.1)
-                    self._log_event(event)
-                except Empty:
+                # Sleep until a producer signals; only time out while a
+                # coalesced move is waiting to be flushed.
+                timeout = self._move_min_dt if self._pending_move is not None else None
+                if not self._event_available.wait(timeout):
+                    if self._pending_move is not None:
+                        self._flush_pending_move()
+                        self._drain_events()
                     continue
+                self._event_available.clear()
+                self._drain_events()
+            self._flush_pending_move()
+            self._drain_events()
         except Exception as e:
             logger.error(f"Error during recording: {e}")
         finally:
@@ -103,6 +154,7 @@ class Recorder(QThread):
             if not self._is_recording:
                 return
             self._is_recording = False
+        self._event_available.set()  # wake the event loop so it can exit
 
         try:
             self.obs_client.stop_recording()
@@ -124,7 +176,7 @@ class Recorder(QThread):
 
         try:
             self.obs_client.pause_recording()
-            self._add_event_to_queue({"action": "pause"})
+            self._add_event_to_queue(self.PAUSE_EVENT, ())
         except Exception as e:
             logger.error(f"Error pausing recording: {e}")
 
@@ -139,77 +191,152 @@ class Recorder(QThread):
 
         try:
             self.obs_client.resume_recording()
-            self._add_event_to_queue({"action": "resume"})
+            self._add_event_to_queue(self.RESUME_EVENT, ())
         except Exception as e:
             logger.error(f"Error resuming recording: {e}")
 
     def on_move(self, x, y):
-        self._add_event_to_queue({"action": "move", "x": x, "y": y})
+        if self._is_paused or not self._is_recording:
+            return
+        now = time.perf_counter()
+        if now - self._last_move_ts < self._move_min_dt:
+            had_pending = self._pending_move is not None
+            self._pending_move = (x, y, now)
+            if not had_pending:
+                self._event_available.set()  # let the consumer arm its flush timeout
+            return
+        self._pending_move = None
+        self._last_move_ts = now
+        self._add_event_to_queue(self.MOVE_EVENT, (x, y), time_stamp=now)
 
     def on_click(self, x, y, button, pressed):
-        self._add_event_to_queue({
-            "action": "click",
-            "x": x,
-            "y": y,
-            "button": button.name,
-            "pressed": pressed
-        })
+        self._add_event_to_queue(self.CLICK_EVENT, (
+            x,
+            y,
+            self._encode_name(button, button.name),
+            b"true" if pressed else b"false"
+        ))
 
     def on_scroll(self, x, y, dx, dy):
-        self._add_event_to_queue({
-            "action": "scroll",
-            "x": x,
-            "y": y,
-            "dx": dx,
-            "dy": dy
-        })
+        self._add_event_to_queue(self.SCROLL_EVENT, (x, y, dx, dy))
 
     def on_press(self, key):
-        self._add_event_to_queue({
-            "action": "press",
-            "key": self._get_key_name(key)
-        })
+        self._add_event_to_queue(self.PRESS_EVENT, (self._encode_name(key, None),))
 
     def on_release(self, key):
-        self._add_event_to_queue({
-            "action": "release",
-            "key": self._get_key_name(key)
-        })
+        self._add_event_to_queue(self.RELEASE_EVENT, (self._encode_name(key, None),))
 
     def _get_key_name(self, key):
         """
         Extracts a string representation of the key.
         """
-        return key.char if isinstance(key, KeyCode) else key.name
+        # KeyCode has .char (possibly None) but no .name; Key has .name only
+        return getattr(key, "char", None) or getattr(key, "name", None)
 
-    def _add_event_to_queue(self, event_data):
+    def _encode_name(self, obj, name):
+        """
+        Returns the JSON-encoded name of a key or button, caching it per object.
+        Keys pass name=None and are resolved through _get_key_name.
+        """
+        try:
+            return self._encoded_names[obj]
+        except KeyError:
+            if name is None:
+                name = self._get_key_name(obj)
+            encoded = self._encoded_names[obj] = orjson.dumps(name)
+            return encoded
+
+    def _add_event_to_queue(self, template, fields, time_stamp=None):
         """
-        Adds an event to the queue with a timestamp.
+        Formats an event line from its template and adds it to the buffer
+        together with its timestamp.
+        Any coalesced mouse move is flushed first to keep events in order.
         """
         if not self._is_paused and self._is_recording:
-            event_data["time_stamp"] = time.perf_counter()
-            self.event_queue.put(event_data, block=False)
-
-    def _log_event(self, event):
+            if self._pending_move is not None:
+                self._flush_pending_move()
+            if time_stamp is None:
+                time_stamp = time.perf_counter()
+            buffer = self._thread_buffer()
+            buffer.append((time_stamp, template % (*fields, time_stamp)))
+            if len(buffer) >= self.BUFFER_CAPACITY and not self._event_available.is_set():
+                self._event_available.set()
+
+    def _thread_buffer(self):
         """
-        Logs an event to the events file.
+        Returns the calling thread's event buffer, registering it on first use.
         """
         try:
-            if self.events_file:
-                self.events_file.write(json.dumps(event) + "\n")
-        except Exception as e:
-            logger.error(f"Error logging event: {e}")
+            return self._local.events
+        except AttributeError:
+            buffer = self._local.events = deque()
+            with self._thread_buffers_lock:
+                self._thread_buffers.append(buffer)
+            return buffer
+
+    def _flush_pending_move(self):
+        """
+        Buffers the latest coalesced mouse move, if any.
+        """
+        pending, self._pending_move = self._pending_move, None
+        if pending is not None:
+            x, y, time_stamp = pending
+            self._last_move_ts = time_stamp
+            self._thread_buffer().append((time_stamp, self.MOVE_EVENT % (x, y, time_stamp)))
+
+    def _drain_events(self):
+        """
+        Pops the events buffered by every thread and logs them in timestamp order.
+        """
+        with self._thread_buffers_lock:
+            buffers = list(self._thread_buffers)
+
+        batches = []
+        for buffer in buffers:
+            pop = buffer.popleft
+            batch = [pop() for _ in range(len(buffer))]
+            if batch:
+                batches.append(batch)
+
+        if len(batches) == 1:
+            self._log_events(batches[0])
+        elif batches:
+            self._log_events(heapq.merge(*batches, key=itemgetter(0)))
+
+    def _log_events(self, events):
+        """
+        Hands a batch of events to the writer thread as a single chunk.
+        """
+        if self._writer_thread is not None:
+            self._write_queue.append(b"".join(line for _, line in events))
+            if not self._write_available.is_set():
+                self._write_available.set()
+
+    def _write_events(self):
+        """
+        Writer thread loop: writes queued chunks to the events file until stopped.
+        """
+        pop = self._write_queue.popleft
+        while True:
+            self._write_available.wait()
+            self._write_available.clear()
+            # Read the flag before draining so chunks queued ahead of it are written
+            done = self._writer_done
+            while self._write_queue:
+                try:
+                    self.events_file.write(pop())
+                except Exception as e:
+                    logger.error(f"Error logging event: {e}")
+            if done:
+                return
 
     def _initialize_recording_directory(self) -> str:
         """
         Creates and returns the path for the current recording session.
         """
-        recordings_dir = get_recordings_dir()
-        os.makedirs(recordings_dir, exist_ok=True)
-
-        current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        recording_path = os.path.join(recordings_dir, f"recording-{current_time}")
-        os.mkdir(recording_path)
+        current_time = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime())
+        recording_path = os.path.join(get_recordings_dir(), f"recording-{current_time}")
+        os.makedirs(recording_path)  # also creates the recordings directory if needed
 
         return recording_path
 
@@ -228,9 +355,14 @@ class Recorder(QThread):
         Opens the events file for logging.
         """
         try:
-            self.events_file = open(os.path.join(self.recording_path, "events.jsonl"), "a")
+            self.events_file = open(os.path.join(self.recording_path, "events.jsonl"), "ab",
+                                    buffering=self.EVENTS_FILE_BUFFER_SIZE)
         except Exception as e:
             logger.error(f"Error opening event file: {e}")
+            return
+
+        self._writer_thread = Thread(target=self._write_events, name="ducktrack-event-writer", daemon=True)
+        self._writer_thread.start()
 
     def _cleanup_resources(self):
         """
@@ -241,6 +373,10 @@ class Recorder(QThread):
                 self.mouse_listener.stop()
             if self.keyboard_listener.running:
                 self.keyboard_listener.stop()
+            if self._writer_thread is not None:
+                self._writer_done = True
+                self._write_available.set()
+                self._writer_thread.join()
             if self.events_file:
                 self.events_file.close()
             self.metadata_manager.save_metadata()
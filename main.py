@@ -1,3 +1,4 @@
+import logging
 import os
 import signal
 import sys
@@ -10,6 +11,7 @@ from ducktrack.recorder import Recorder  # Ensure Recorder is imported if used i
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     signal.signal(signal.SIGINT, signal.SIG_DFL)